@@ -4,10 +4,40 @@ Extractors Package
 This package provides database extractors for various database systems.
 Each extractor implements the BaseExtractor interface defined in the
 abstractextractor module.
+
+Database-specific subpackages are imported lazily, so importing this package
+does not load any database driver. Use the registry to resolve extractors by
+name, e.g. ``create_extractor_from_env()`` in a single-source worker.
 """
 
-# Import subpackages to make them available when importing the extractors package
+import importlib
+
 from . import abstractextractor
-from . import sqlserver
+from .registry import (
+    available_extractors,
+    create_extractor,
+    create_extractor_from_env,
+    get_extractor_class,
+    register_extractor,
+)
+
+_LAZY_SUBPACKAGES = ("mysql", "sqlserver", "pipeline")
+
+__all__ = [
+    "abstractextractor",
+    "mysql",
+    "sqlserver",
+    "pipeline",
+    "available_extractors",
+    "create_extractor",
+    "create_extractor_from_env",
+    "get_extractor_class",
+    "register_extractor",
+]
+
 
-__all__ = ["abstractextractor", "sqlserver"]
+def __getattr__(name):
+    # Import driver-backed subpackages on first attribute access only
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
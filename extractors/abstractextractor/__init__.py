@@ -5,6 +5,7 @@ This package provides the base extractor class that defines the interface
 for all database-specific extractors in the data framework engine.
 """
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, iter_batches
+from .profiling import PROFILE_MODES, HyperLogLog, ReservoirSample, profile_rows
 
-__all__ = ['BaseExtractor']
+__all__ = ['BaseExtractor', 'iter_batches', 'PROFILE_MODES', 'HyperLogLog', 'ReservoirSample', 'profile_rows']
@@ -14,10 +14,15 @@ class BaseExtractor(ABC):
         pass
 
     @abstractmethod
-    def extract_metadata(self):
+    def extract_metadata(self, profile=None):
         """
         Extract metadata from the database.
         Must be implemented by subclasses.
+
+        Args:
+            profile (str): Optional profiling mode, one of PROFILE_MODES.
+                "catalog" adds the statistics the database already keeps,
+                "full" scans each table once to compute column statistics.
         """
         pass
 
@@ -34,6 +39,24 @@ class BaseExtractor(ABC):
         """
         pass
 
+    def read_batches(self, query, batch_size=1000):
+        """
+        Execute a query and yield the results in batches.
+
+        Subclasses should override this to fetch from the cursor incrementally;
+        the default implementation reads the full result with read_data().
+
+        Args:
+            query (str): SQL query to execute
+            batch_size (int): Maximum number of rows per batch
+
+        Yields:
+            list: Batch of rows, in the same form as read_data() returns them
+        """
+        rows = self.read_data(query)
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
     @abstractmethod
     def close_connection(self):
         """
@@ -41,3 +64,21 @@ class BaseExtractor(ABC):
         Must be implemented by subclasses.
         """
         pass
+
+
+def iter_batches(cursor, batch_size=1000):
+    """
+    Yield rows from an executed cursor in batches without fetching them all.
+
+    Args:
+        cursor: DB-API cursor with a pending result set
+        batch_size (int): Rows fetched per round-trip
+
+    Yields:
+        list: Batch of rows
+    """
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
@@ -0,0 +1,284 @@
+"""
+Column Profiling
+
+This module provides the streaming statistics used by extract_metadata when
+profiling is enabled. A table is profiled in a single pass over its rows:
+row and null counts, min/max, a HyperLogLog distinct-count estimate and an
+optional reservoir sample per column, all in memory bounded by the number of
+columns. Results only contain JSON-serializable values, so they can be posted
+to the metadata repository with the rest of the metadata.
+"""
+
+import datetime
+import decimal
+import hashlib
+import math
+import random
+
+# Supported values for the ``profile`` argument of extract_metadata:
+# None skips profiling, "catalog" reads the database's own statistics only,
+# "full" scans every table once.
+PROFILE_MODES = (None, "catalog", "full")
+
+
+def validate_profile_mode(profile):
+    """
+    Check that a profile mode is supported.
+
+    Args:
+        profile (str): Profile mode passed to extract_metadata
+
+    Raises:
+        ValueError: If the mode is not one of PROFILE_MODES
+    """
+    if profile not in PROFILE_MODES:
+        raise ValueError(f"Invalid profile mode '{profile}', expected one of {PROFILE_MODES}")
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for estimating the number of distinct values.
+
+    With the default precision of 12 the sketch uses 4096 one-byte registers
+    and has a standard error of about 1.6%.
+    """
+
+    def __init__(self, precision=12):
+        """
+        Initialize the sketch.
+
+        Args:
+            precision (int): Number of index bits, between 4 and 16
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+        self._value_bits = 64 - precision
+        self._value_mask = (1 << self._value_bits) - 1
+
+    def add(self, value):
+        """
+        Add a value to the sketch.
+
+        Args:
+            value: Any non-null column value
+        """
+        if isinstance(value, bytes):
+            data = value
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+        else:
+            data = repr(value).encode("utf-8")
+
+        hashed = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+        index = hashed >> self._value_bits
+        rank = self._value_bits - (hashed & self._value_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        """
+        Estimate the number of distinct values added.
+
+        Returns:
+            int: Estimated distinct count
+        """
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+
+class ReservoirSample:
+    """
+    Fixed-size uniform random sample of a stream of values.
+    """
+
+    def __init__(self, size=100, rng=None):
+        """
+        Initialize the sample.
+
+        Args:
+            size (int): Maximum number of values kept
+            rng (random.Random): Random generator, for reproducible samples
+        """
+        self.size = size
+        self.values = []
+        self.seen = 0
+        self._rng = rng or random.Random()
+
+    def add(self, value):
+        """
+        Offer a value to the sample.
+
+        Args:
+            value: Column value
+        """
+        self.seen += 1
+        if len(self.values) < self.size:
+            self.values.append(value)
+        else:
+            slot = self._rng.randrange(self.seen)
+            if slot < self.size:
+                self.values[slot] = value
+
+
+class ColumnProfiler:
+    """
+    Accumulates statistics for a single column.
+    """
+
+    def __init__(self, sample_size=0, precision=12, rng=None):
+        """
+        Initialize the profiler.
+
+        Args:
+            sample_size (int): Size of the reservoir sample of non-null values;
+                0 disables sampling. Min and max are still reported, with text
+                and binary values cut to a short prefix (see json_safe)
+            precision (int): HyperLogLog precision
+            rng (random.Random): Random generator for the reservoir sample
+        """
+        self.null_count = 0
+        self.min = None
+        self.max = None
+        self._comparable = True
+        self.distinct = HyperLogLog(precision)
+        self.sample = ReservoirSample(sample_size, rng)
+
+    def add(self, value):
+        """
+        Add a column value.
+
+        Args:
+            value: Column value, None for SQL NULL
+        """
+        if value is None:
+            self.null_count += 1
+            return
+
+        self.distinct.add(value)
+        if self.sample.size:
+            self.sample.add(value)
+
+        if self._comparable:
+            try:
+                if self.min is None or value < self.min:
+                    self.min = value
+                if self.max is None or value > self.max:
+                    self.max = value
+            except TypeError:
+                # Values without an ordering (or of mixed types) have no min/max
+                self._comparable = False
+                self.min = self.max = None
+
+    def result(self, row_count):
+        """
+        Return the collected statistics.
+
+        Args:
+            row_count (int): Number of rows in the table
+
+        Returns:
+            dict: Null count and ratio, min, max and distinct estimate, plus
+            the sample if sampling is enabled; values are JSON-serializable
+        """
+        result = {
+            "null_count": self.null_count,
+            "null_ratio": self.null_count / row_count if row_count else 0.0,
+            "min": json_safe(self.min),
+            "max": json_safe(self.max),
+            "distinct_estimate": min(self.distinct.count(), row_count - self.null_count),
+        }
+        if self.sample.size:
+            result["sample"] = [json_safe(value) for value in self.sample.values]
+        return result
+
+
+def json_safe(value, max_length=16):
+    """
+    Convert a driver value to a short JSON-serializable form.
+
+    Args:
+        value: Column value as returned by the database driver
+        max_length (int): Characters of text, or bytes of a binary value,
+            kept before the value is cut off with "..."
+
+    Returns:
+        Dates and times as ISO strings, decimals as strings, text as a
+        prefix and binary values as a hex prefix; numbers and booleans are
+        returned unchanged and anything else as its string form
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        # Keeps a TEXT/nvarchar(max) column from putting whole documents into the metadata
+        return value[:max_length] + "..." if len(value) > max_length else value
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        suffix = "..." if len(data) > max_length else ""
+        return f"0x{data[:max_length].hex()}{suffix}"
+    return str(value)
+
+
+def profile_rows(column_names, batches, sample_size=0, precision=12, seed=None):
+    """
+    Profile a table in a single pass over its rows.
+
+    Args:
+        column_names (list): Column names, in the order of the row values
+        batches (iterable): Batches of row sequences, e.g. from iter_batches()
+        sample_size (int): Size of the reservoir sample per column; 0 disables it
+        precision (int): HyperLogLog precision
+        seed (int): Seed for the reservoir samples
+
+    Returns:
+        dict: ``{"row_count": int, "columns": {name: statistics}}``
+    """
+    rng = random.Random(seed)
+    profilers = [ColumnProfiler(sample_size, precision, rng) for _ in column_names]
+    row_count = 0
+
+    for batch in batches:
+        for row in batch:
+            row_count += 1
+            for profiler, value in zip(profilers, row):
+                profiler.add(value)
+
+    return {
+        "row_count": row_count,
+        "columns": {
+            name: profiler.result(row_count)
+            for name, profiler in zip(column_names, profilers)
+        },
+    }
+
+
+def attach_statistics(table_info, row_count, source, column_statistics=None):
+    """
+    Store profiling results on a table entry of extract_metadata's output.
+
+    Args:
+        table_info (dict): Table entry with a "columns" list
+        row_count (int): Exact or estimated row count, None if unknown
+        source (str): Where the statistics came from, "catalog" or "scan"
+        column_statistics (dict): Statistics keyed by column name
+    """
+    table_info["statistics"] = {"row_count": row_count, "source": source}
+
+    column_statistics = column_statistics or {}
+    for column in table_info["columns"]:
+        if column["name"] in column_statistics:
+            column["statistics"] = column_statistics[column["name"]]
@@ -9,7 +9,12 @@ This module provides functionality to extract data and metadata from MySQL datab
 # pylint: disable=import-error
 import mysql.connector
 # pylint: enable=import-error
-from extractors.abstractextractor import BaseExtractor
+from extractors.abstractextractor import BaseExtractor, iter_batches
+from extractors.abstractextractor.profiling import (
+    attach_statistics,
+    profile_rows,
+    validate_profile_mode,
+)
 
 class MySQLExtractor(BaseExtractor):
     """
@@ -59,15 +64,24 @@ class MySQLExtractor(BaseExtractor):
             print(f"Error connecting to MySQL database: {err}")
             return False
             
-    def extract_metadata(self):
+    def extract_metadata(self, profile=None, sample_size=0):
         """
         Extract metadata from the MySQL database.
         
+        Args:
+            profile (str): None for schema only, "catalog" to add row counts and
+                index cardinalities from information_schema, or "full" to scan
+                each table once for row counts, null ratios, min/max, distinct
+                estimates and samples
+            sample_size (int): Values sampled per column in "full" mode;
+                0 (the default) stores no sample; min/max text is cut to a prefix
+            
         Returns:
             dict: Dictionary containing database metadata
         """
         if not self.connection or not self.cursor:
             raise ConnectionError("Not connected to database. Call connect() first.")
+        validate_profile_mode(profile)
             
         metadata = {
             "tables": [],
@@ -96,10 +110,68 @@ class MySQLExtractor(BaseExtractor):
                     "extra": column["Extra"]
                 })
                 
+            if profile == "catalog":
+                self._attach_catalog_statistics(table_info)
+            elif profile == "full":
+                self._attach_scan_statistics(table_info, sample_size)
+                
             metadata["tables"].append(table_info)
             
         return metadata
         
+    def _attach_catalog_statistics(self, table_info):
+        """
+        Attach the row count estimate and index cardinalities kept by MySQL.
+        
+        Args:
+            table_info (dict): Table entry built by extract_metadata
+        """
+        self.cursor.execute(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+            (self.database, table_info["name"])
+        )
+        row = self.cursor.fetchone()
+        row_count = row["TABLE_ROWS"] if row else None
+        
+        # The cardinality of a column that leads an index estimates its distinct count
+        self.cursor.execute(
+            "SELECT COLUMN_NAME, MAX(CARDINALITY) AS CARDINALITY "
+            "FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND SEQ_IN_INDEX = 1 "
+            "GROUP BY COLUMN_NAME",
+            (self.database, table_info["name"])
+        )
+        column_statistics = {
+            row["COLUMN_NAME"]: {"distinct_estimate": row["CARDINALITY"]}
+            for row in self.cursor.fetchall()
+            if row["CARDINALITY"] is not None
+        }
+        
+        attach_statistics(table_info, row_count, "catalog", column_statistics)
+        
+    def _attach_scan_statistics(self, table_info, sample_size):
+        """
+        Profile a table in one streaming pass and attach the results.
+        
+        Args:
+            table_info (dict): Table entry built by extract_metadata
+            sample_size (int): Values kept per column
+        """
+        table_name = table_info["name"].replace("`", "``")
+        # Unbuffered tuple cursor, so rows are streamed rather than loaded at once
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT * FROM `{table_name}`")
+            column_names = [column[0] for column in cursor.description]
+            result = profile_rows(column_names, iter_batches(cursor), sample_size=sample_size)
+        except mysql.connector.Error as err:
+            raise RuntimeError(f"Error profiling table {table_info['name']}: {err}") from err
+        finally:
+            _close_unbuffered(cursor)
+            
+        attach_statistics(table_info, result["row_count"], "scan", result["columns"])
+        
     def read_data(self, query):
         """
         Execute a query and return the results.
@@ -120,6 +192,37 @@ class MySQLExtractor(BaseExtractor):
             print(f"Error executing query: {err}")
             return []
             
+    def read_batches(self, query, batch_size=1000):
+        """
+        Execute a query and yield the results in batches.
+        
+        Rows are fetched from an unbuffered cursor with fetchmany, so only one
+        batch is held in memory at a time.
+        
+        Args:
+            query (str): SQL query to execute
+            batch_size (int): Maximum number of rows per batch
+            
+        Yields:
+            list: Batch of dictionaries containing the query results
+            
+        Raises:
+            ConnectionError: If not connected to the database
+            RuntimeError: If the query fails
+        """
+        if not self.connection or not self.cursor:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+            
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            cursor.execute(query)
+            for batch in iter_batches(cursor, batch_size):
+                yield batch
+        except mysql.connector.Error as err:
+            raise RuntimeError(f"Error executing query: {err}") from err
+        finally:
+            _close_unbuffered(cursor, batch_size)
+            
     def close_connection(self):
         """
         Close the database connection.
@@ -139,3 +242,18 @@ class MySQLExtractor(BaseExtractor):
                 return False
         
         return True
+
+
+def _close_unbuffered(cursor, batch_size=1000):
+    # An unbuffered cursor cannot be closed while rows are unread, e.g. when
+    # the caller stopped early or the read failed, so discard them first.
+    # Drain in bounded chunks so abandoning a large result keeps memory flat.
+    try:
+        while cursor.fetchmany(batch_size):
+            pass
+    except mysql.connector.Error:
+        pass
+    try:
+        cursor.close()
+    except mysql.connector.Error:
+        pass
@@ -0,0 +1,11 @@
+"""
+Pipeline Package
+
+This package provides the runtime that connects extractors to the CDC stream
+through a bounded buffer that spills to local disk when the stream falls behind.
+"""
+
+from .extract_pipeline import ExtractPipeline
+from .spill_queue import SpillQueue
+
+__all__ = ['ExtractPipeline', 'SpillQueue']
@@ -0,0 +1,205 @@
+"""
+Extract Pipeline
+
+This module connects a BaseExtractor to a CDCStream. Rows are read from the
+source one batch at a time with read_batches() and handed to a background
+stream stage through a SpillQueue, so a slow broker never blocks the source
+cursor and never grows memory without bound.
+"""
+
+import logging
+import threading
+import time
+
+from extractors.pipeline.spill_queue import SpillQueue
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractPipeline:
+    """
+    Runs queries against an extractor and streams the rows to a CDC stream.
+
+    The extract stage runs on the calling thread and the stream stage on a
+    background thread. Any object with a ``stream_changes(changes)`` method
+    can be used as the stream.
+    """
+
+    def __init__(self, extractor, stream, batch_size=500, high_watermark=10000, low_watermark=2000,
+                 spill_dir=None, segment_rows=5000, max_retries=3, retry_backoff=1.0):
+        """
+        Initialize the pipeline.
+
+        Args:
+            extractor (BaseExtractor): Connected extractor to read from
+            stream (CDCStream): Stream that receives the extracted rows
+            batch_size (int): Rows per batch read from the source and handed
+                to the stream
+            high_watermark (int): Rows buffered in memory before spilling to disk
+            low_watermark (int): Rows in memory below which spilling stops
+            spill_dir (str): Directory for spill segments; a temporary
+                directory is used when not provided
+            segment_rows (int): Rows per spill segment file
+            max_retries (int): Attempts to resend a batch after a stream error
+            retry_backoff (float): Seconds to wait before the first retry,
+                doubled on each further attempt
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.extractor = extractor
+        self.stream = stream
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.queue = SpillQueue(
+            high_watermark=high_watermark,
+            low_watermark=low_watermark,
+            spill_dir=spill_dir,
+            segment_rows=segment_rows
+        )
+
+        self._lock = threading.Lock()
+        self._stream_error = None
+        self._extract_stats = {"queries": 0, "rows": 0, "batches": 0, "seconds": 0.0}
+        self._stream_stats = {"rows": 0, "batches": 0, "retries": 0, "seconds": 0.0,
+                              "last_latency_seconds": 0.0}
+
+    def run(self, queries):
+        """
+        Extract the results of each query and stream them until fully delivered.
+
+        Args:
+            queries (list): SQL queries to execute against the extractor
+
+        Returns:
+            dict: Final pipeline statistics, as returned by stats()
+
+        Raises:
+            RuntimeError: If the stream stage fails after all retries, or
+                stops before every extracted row has been delivered
+        """
+        worker = threading.Thread(target=self._stream_worker, name="extract-pipeline-stream")
+        worker.daemon = True
+        worker.start()
+
+        try:
+            for query in queries:
+                self._check_stream()
+                self._extract(query)
+        finally:
+            self.queue.close()
+            worker.join()
+            self.queue.cleanup()
+
+        self._check_stream()
+        stats = self.stats()
+        if stats["lag_rows"]:
+            raise RuntimeError(f"Stream stage stopped with {stats['lag_rows']} extracted rows undelivered")
+        return stats
+
+    def stats(self):
+        """
+        Return per-stage counters and the current lag between the stages.
+
+        Returns:
+            dict: Statistics for the extract stage, stream stage and buffer,
+            plus ``lag_rows`` (extracted but not yet streamed) and
+            ``lag_seconds`` (age of the oldest pending batch)
+        """
+        buffer_stats = self.queue.stats()
+        with self._lock:
+            extract_stats = dict(self._extract_stats)
+            stream_stats = dict(self._stream_stats)
+
+        return {
+            "extract": extract_stats,
+            "stream": stream_stats,
+            "buffer": buffer_stats,
+            "lag_rows": extract_stats["rows"] - stream_stats["rows"],
+            "lag_seconds": buffer_stats["oldest_pending_seconds"],
+        }
+
+    def _extract(self, query):
+        started = time.monotonic()
+        batches = self.extractor.read_batches(query, self.batch_size)
+
+        try:
+            for batch in batches:
+                # Stop reading as soon as the stream stage has given up
+                self._check_stream()
+                self.queue.put(batch)
+                with self._lock:
+                    self._extract_stats["rows"] += len(batch)
+                    self._extract_stats["batches"] += 1
+        finally:
+            # Release the source cursor even when the read is abandoned
+            batches.close()
+
+        with self._lock:
+            self._extract_stats["queries"] += 1
+            self._extract_stats["seconds"] += time.monotonic() - started
+
+    def _stream_worker(self):
+        while True:
+            try:
+                item = self.queue.get()
+            except Exception as e:  # pylint: disable=broad-except
+                # The buffer itself failed (e.g. an unreadable spill segment),
+                # so nothing more can be delivered
+                logger.error(f"Stream stage failed reading the buffer: {e}")
+                self._record_stream_error(e)
+                return
+
+            if item is None:
+                return
+
+            with self._lock:
+                failed = self._stream_error is not None
+            if failed:
+                # Keep draining so the extract stage does not fill the spill directory
+                continue
+
+            try:
+                enqueued_at, rows = item
+                started = time.monotonic()
+                self._send(rows)
+                finished = time.monotonic()
+                with self._lock:
+                    self._stream_stats["rows"] += len(rows)
+                    self._stream_stats["batches"] += 1
+                    self._stream_stats["seconds"] += finished - started
+                    self._stream_stats["last_latency_seconds"] = finished - enqueued_at
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"Stream stage failed: {e}")
+                self._record_stream_error(e)
+
+    def _record_stream_error(self, error):
+        with self._lock:
+            if self._stream_error is None:
+                self._stream_error = error
+
+    def _send(self, rows):
+        attempt = 0
+        while True:
+            try:
+                self.stream.stream_changes(rows)
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * (2 ** attempt)
+                attempt += 1
+                logger.warning(f"Stream error, retrying in {delay:.1f}s ({attempt}/{self.max_retries}): {e}")
+                with self._lock:
+                    self._stream_stats["retries"] += 1
+                time.sleep(delay)
+
+    def _check_stream(self):
+        with self._lock:
+            error = self._stream_error
+        if error is not None:
+            raise RuntimeError(f"Error streaming extracted rows: {error}") from error
@@ -0,0 +1,234 @@
+"""
+Spill Queue
+
+This module provides a bounded, non-blocking hand-off buffer between the
+extract stage and the stream stage of a pipeline. Batches are held in memory
+until the high watermark is reached, after which new batches are written to
+local disk segments until the consumer has caught up below the low watermark.
+"""
+
+import os
+import pickle
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+
+
+class SpillQueue:
+    """
+    FIFO queue of row batches that spills to disk instead of blocking.
+
+    The producer never waits on the consumer: ``put`` always returns
+    immediately, so a source cursor keeps being drained while the sink is
+    slow. Memory usage is capped at roughly ``high_watermark`` rows plus one
+    disk segment being read back.
+    """
+
+    def __init__(self, high_watermark=10000, low_watermark=2000, spill_dir=None, segment_rows=5000):
+        """
+        Initialize the queue.
+
+        Args:
+            high_watermark (int): Rows held in memory before spilling starts
+            low_watermark (int): Rows in memory below which spilling stops,
+                once all spilled segments have been read back
+            spill_dir (str): Directory for spill segments; a temporary
+                directory is created when not provided
+            segment_rows (int): Rows written to a segment before a new one is started
+
+        Raises:
+            ValueError: If the watermarks or segment size are invalid
+        """
+        if high_watermark <= 0 or segment_rows <= 0:
+            raise ValueError("high_watermark and segment_rows must be positive")
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("low_watermark must be between 0 and high_watermark")
+
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.segment_rows = segment_rows
+
+        self._owns_spill_dir = spill_dir is None
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix="extract-spill-")
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        self._condition = threading.Condition()
+        self._memory = deque()
+        self._memory_rows = 0
+        self._segments = deque()
+        self._writer = None
+        self._writer_path = None
+        self._writer_rows = 0
+        self._writer_first = None
+        self._segment_seq = 0
+        self._disk_rows = 0
+        self._spilling = False
+        self._closed = False
+
+        self.spilled_rows = 0
+        self.spilled_segments = 0
+
+    def put(self, rows):
+        """
+        Add a batch of rows to the queue without blocking.
+
+        Args:
+            rows (list): Batch of rows to enqueue
+
+        Raises:
+            RuntimeError: If the queue has been closed
+        """
+        if not rows:
+            return
+
+        item = (time.monotonic(), rows)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot put to a closed SpillQueue")
+
+            if not self._spilling and self._memory_rows + len(rows) > self.high_watermark:
+                self._spilling = True
+
+            if self._spilling:
+                self._spill(item)
+            else:
+                self._memory.append(item)
+                self._memory_rows += len(rows)
+
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest batch.
+
+        Args:
+            timeout (float): Seconds to wait for a batch; waits indefinitely if None
+
+        Returns:
+            tuple: ``(enqueued_at, rows)`` for the oldest batch, or None once
+            the queue is closed and drained
+
+        Raises:
+            queue.Empty: If the timeout expires before a batch is available
+        """
+        with self._condition:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._memory and not self._disk_rows:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._condition.wait(remaining)
+
+            if not self._memory:
+                self._load_segment()
+
+            enqueued_at, rows = self._memory.popleft()
+            self._memory_rows -= len(rows)
+
+            if self._spilling and not self._disk_rows and self._memory_rows <= self.low_watermark:
+                self._spilling = False
+
+            return enqueued_at, rows
+
+    def close(self):
+        """
+        Mark the queue as complete; consumers drain the remaining batches.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def cleanup(self):
+        """
+        Remove any remaining spill segments from disk.
+        """
+        with self._condition:
+            self._close_writer()
+            for path, _, _ in self._segments:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._segments.clear()
+            self._disk_rows = 0
+
+        if self._owns_spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def stats(self):
+        """
+        Return a snapshot of the queue depth.
+
+        Returns:
+            dict: Row counts in memory and on disk, spill totals and the age
+            in seconds of the oldest pending batch
+        """
+        with self._condition:
+            oldest = None
+            if self._memory:
+                oldest = self._memory[0][0]
+            elif self._segments:
+                oldest = self._segments[0][2]
+            elif self._writer:
+                oldest = self._writer_first
+            oldest_age = 0.0 if oldest is None else time.monotonic() - oldest
+            return {
+                "memory_rows": self._memory_rows,
+                "disk_rows": self._disk_rows,
+                "disk_segments": len(self._segments) + (1 if self._writer else 0),
+                "spilling": self._spilling,
+                "spilled_rows": self.spilled_rows,
+                "spilled_segments": self.spilled_segments,
+                "oldest_pending_seconds": oldest_age,
+            }
+
+    def _spill(self, item):
+        if self._writer is None:
+            self._segment_seq += 1
+            self._writer_path = os.path.join(self.spill_dir, f"segment-{self._segment_seq:08d}.bin")
+            self._writer = open(self._writer_path, "wb")
+            self._writer_rows = 0
+            self._writer_first = item[0]
+            self.spilled_segments += 1
+
+        pickle.dump(item, self._writer, protocol=pickle.HIGHEST_PROTOCOL)
+        rows = len(item[1])
+        self._writer_rows += rows
+        self._disk_rows += rows
+        self.spilled_rows += rows
+
+        if self._writer_rows >= self.segment_rows:
+            self._close_writer()
+
+    def _close_writer(self):
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._segments.append((self._writer_path, self._writer_rows, self._writer_first))
+        self._writer = None
+        self._writer_path = None
+        self._writer_rows = 0
+        self._writer_first = None
+
+    def _load_segment(self):
+        # Segments are only read once sealed, so seal the one being written
+        # if the consumer has caught up to it.
+        if not self._segments:
+            self._close_writer()
+
+        path, rows, _ = self._segments.popleft()
+        with open(path, "rb") as segment:
+            while True:
+                try:
+                    item = pickle.load(segment)
+                except EOFError:
+                    break
+                self._memory.append(item)
+                self._memory_rows += len(item[1])
+        os.remove(path)
+        self._disk_rows -= rows
@@ -0,0 +1,203 @@
+"""
+Extractor Registry
+
+This module resolves extractors by name and creates them from configuration.
+Extractor modules, and the database drivers they import, are only loaded the
+first time an extractor is requested, so a worker only pays for the driver it
+actually uses.
+"""
+
+import importlib
+import os
+import threading
+
+try:
+    from importlib.metadata import entry_points
+except ImportError:  # pragma: no cover - Python < 3.8
+    entry_points = None
+
+# Entry-point group third-party packages use to register extractors, e.g.
+# [project.entry-points."data_framework_engine.extractors"]
+# db2 = "my_package.db2_extractor:DB2Extractor"
+ENTRY_POINT_GROUP = "data_framework_engine.extractors"
+
+# Environment variables read by create_extractor_from_env (see docker-compose.yml)
+ENV_VARS = {
+    "host": "DB_HOST",
+    "port": "DB_PORT",
+    "database": "DB_NAME",
+    "user": "DB_USER",
+    "password": "DB_PASSWORD",
+}
+ENV_EXTRACTOR_TYPE = "DB_TYPE"
+
+_lock = threading.Lock()
+_targets = {
+    "mysql": "extractors.mysql.mysql_extractor:MySQLExtractor",
+    "sqlserver": "extractors.sqlserver.sqlserver_extractor:SQLServerExtractor",
+}
+_default_ports = {
+    "mysql": 3306,
+    "sqlserver": 1433,
+}
+_loaded = {}
+_entry_points_loaded = False
+
+
+def register_extractor(name, target, default_port=None):
+    """
+    Register an extractor under a name.
+
+    Args:
+        name (str): Name used to look the extractor up, e.g. "mysql"
+        target (str or type): Extractor class, or a "module:ClassName" string
+            that is imported on first use
+        default_port (int): Port used when none is configured
+
+    Raises:
+        ValueError: If the target string is not of the form "module:ClassName"
+    """
+    if isinstance(target, str) and ":" not in target:
+        raise ValueError(f"Invalid extractor target '{target}', expected 'module:ClassName'")
+
+    key = name.lower()
+    with _lock:
+        _targets[key] = target
+        _loaded.pop(key, None)
+        if default_port is not None:
+            _default_ports[key] = default_port
+
+
+def available_extractors():
+    """
+    List the names of all registered extractors, including entry points.
+
+    Returns:
+        list: Sorted extractor names
+    """
+    _load_entry_points()
+    with _lock:
+        return sorted(_targets)
+
+
+def get_extractor_class(name):
+    """
+    Resolve an extractor class by name, importing its module if needed.
+
+    Args:
+        name (str): Registered extractor name
+
+    Returns:
+        type: The BaseExtractor subclass registered under the name
+
+    Raises:
+        KeyError: If no extractor is registered under the name
+        ImportError: If the extractor module or its driver cannot be imported
+    """
+    key = name.lower()
+    with _lock:
+        if key in _loaded:
+            return _loaded[key]
+        registered = key in _targets
+
+    if not registered:
+        _load_entry_points()
+
+    with _lock:
+        if key not in _targets:
+            raise KeyError(f"Unknown extractor '{name}'. Available: {', '.join(sorted(_targets))}")
+        target = _targets[key]
+
+    extractor_class = _resolve(target) if isinstance(target, str) else target
+    with _lock:
+        _loaded[key] = extractor_class
+    return extractor_class
+
+
+def create_extractor(name, host, database, user, password, port=None):
+    """
+    Create an extractor instance by name.
+
+    Args:
+        name (str): Registered extractor name
+        host (str): Database host address
+        database (str): Database name
+        user (str): Database username
+        password (str): Database password
+        port (int): Database port; the extractor's default port if None
+
+    Returns:
+        BaseExtractor: A new, unconnected extractor
+
+    Raises:
+        ValueError: If no port is given and the extractor has no default port
+    """
+    extractor_class = get_extractor_class(name)
+    if port is None:
+        port = _default_ports.get(name.lower())
+        if port is None:
+            raise ValueError(f"No port configured for extractor '{name}'")
+
+    return extractor_class(host=host, port=int(port), database=database, user=user, password=password)
+
+
+def create_extractor_from_env(name=None, environ=None):
+    """
+    Create an extractor from DB_* environment variables.
+
+    Args:
+        name (str): Extractor name; read from DB_TYPE if None
+        environ (dict): Environment to read from; defaults to os.environ
+
+    Returns:
+        BaseExtractor: A new, unconnected extractor
+
+    Raises:
+        ValueError: If the extractor name is missing or not registered, or a
+            required variable is missing
+    """
+    environ = os.environ if environ is None else environ
+    name = name or environ.get(ENV_EXTRACTOR_TYPE)
+    if not name:
+        raise ValueError(f"Configuration error: {ENV_EXTRACTOR_TYPE} is not set")
+
+    params = {}
+    for param, var in ENV_VARS.items():
+        value = environ.get(var)
+        if value is None and param != "port":
+            raise ValueError(f"Configuration error: {var} is not set")
+        params[param] = value
+
+    try:
+        get_extractor_class(name)
+    except KeyError as e:
+        raise ValueError(f"Configuration error: {e.args[0]}") from e
+
+    return create_extractor(name, **params)
+
+
+def _resolve(target):
+    module_name, _, attr = target.partition(":")
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attr)
+    except AttributeError as e:
+        raise ImportError(f"Module '{module_name}' has no extractor '{attr}'") from e
+
+
+def _load_entry_points():
+    global _entry_points_loaded  # pylint: disable=global-statement
+    with _lock:
+        if _entry_points_loaded or entry_points is None:
+            return
+        _entry_points_loaded = True
+
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            group = eps.select(group=ENTRY_POINT_GROUP)
+        else:
+            group = eps.get(ENTRY_POINT_GROUP, [])
+
+        for ep in group:
+            # Built-in registrations take precedence over entry points
+            _targets.setdefault(ep.name.lower(), ep.value)
@@ -3,7 +3,12 @@
 # pylint: disable=import-error
 import pyodbc
 # pylint: enable=import-error
-from extractors.abstractextractor import BaseExtractor
+from extractors.abstractextractor import BaseExtractor, iter_batches
+from extractors.abstractextractor.profiling import (
+    attach_statistics,
+    profile_rows,
+    validate_profile_mode,
+)
 
 class SQLServerExtractor(BaseExtractor):
     """
@@ -64,18 +69,27 @@ class SQLServerExtractor(BaseExtractor):
             else:
                 raise ConnectionError(f"Failed to connect to SQL Server: {error_msg}") from e
 
-    def extract_metadata(self):
+    def extract_metadata(self, profile=None, sample_size=0):
         """
         Extract metadata from the SQL Server database.
         
+        Args:
+            profile (str): None for schema only, "catalog" to add row counts
+                from sys.partitions, or "full" to scan each table once for row
+                counts, null ratios, min/max, distinct estimates and samples
+            sample_size (int): Values sampled per column in "full" mode;
+                0 (the default) stores no sample; min/max text is cut to a prefix
+            
         Returns:
             dict: Dictionary containing database metadata
             
         Raises:
             ConnectionError: If not connected to the database
+            ValueError: If the profile mode is not supported
         """
         if not self.connection or not self.cursor:
             raise ConnectionError("Not connected to database. Call connect() first.")
+        validate_profile_mode(profile)
             
         metadata = {
             "tables": [],
@@ -84,7 +98,7 @@ class SQLServerExtractor(BaseExtractor):
         
         # Get list of tables
         table_query = """
-            SELECT TABLE_NAME
+            SELECT TABLE_SCHEMA, TABLE_NAME
             FROM INFORMATION_SCHEMA.TABLES
             WHERE TABLE_TYPE = 'BASE TABLE' AND TABLE_CATALOG = ?
         """
@@ -92,8 +106,8 @@ class SQLServerExtractor(BaseExtractor):
         tables = self.cursor.fetchall()
         
         for table in tables:
-            table_name = table[0]
-            table_info = {"name": table_name, "columns": []}
+            table_schema, table_name = table[0], table[1]
+            table_info = {"name": table_name, "schema": table_schema, "columns": []}
             
             # Get column information
             column_query = """
@@ -106,10 +120,10 @@ class SQLServerExtractor(BaseExtractor):
                     NUMERIC_PRECISION,
                     NUMERIC_SCALE
                 FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_NAME = ? AND TABLE_CATALOG = ?
+                WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ? AND TABLE_CATALOG = ?
                 ORDER BY ORDINAL_POSITION
             """
-            self.cursor.execute(column_query, (table_name, self.database))
+            self.cursor.execute(column_query, (table_schema, table_name, self.database))
             columns = self.cursor.fetchall()
             
             for column in columns:
@@ -132,10 +146,95 @@ class SQLServerExtractor(BaseExtractor):
                     "default": default_val
                 })
                 
+            if profile == "catalog":
+                self._attach_catalog_statistics(table_info)
+            elif profile == "full":
+                self._attach_scan_statistics(table_info, sample_size)
+                
             metadata["tables"].append(table_info)
             
         return metadata
 
+    def _attach_catalog_statistics(self, table_info):
+        """
+        Attach the row count SQL Server keeps for the heap or clustered index,
+        and a distinct estimate for each column that leads a statistics object.
+        
+        The estimate is 1 / "All density" of the statistics' density vector.
+        Statistics that cannot be read, e.g. for lack of permission, are skipped.
+        
+        Args:
+            table_info (dict): Table entry built by extract_metadata
+        """
+        row_count_query = """
+            SELECT SUM(p.rows)
+            FROM sys.partitions p
+            JOIN sys.tables t ON t.object_id = p.object_id
+            JOIN sys.schemas s ON s.schema_id = t.schema_id
+            WHERE s.name = ? AND t.name = ? AND p.index_id IN (0, 1)
+        """
+        self.cursor.execute(row_count_query, (table_info["schema"], table_info["name"]))
+        row = self.cursor.fetchone()
+        row_count = row[0] if row else None
+        
+        schema = table_info["schema"].replace("]", "]]")
+        table_name = table_info["name"].replace("]", "]]")
+        qualified_name = f"[{schema}].[{table_name}]"
+        leading_columns_query = """
+            SELECT st.name, c.name
+            FROM sys.stats st
+            JOIN sys.stats_columns sc
+                ON sc.object_id = st.object_id AND sc.stats_id = st.stats_id AND sc.stats_column_id = 1
+            JOIN sys.columns c ON c.object_id = sc.object_id AND c.column_id = sc.column_id
+            WHERE st.object_id = OBJECT_ID(?)
+        """
+        self.cursor.execute(leading_columns_query, (qualified_name,))
+        leading_columns = self.cursor.fetchall()
+        
+        column_statistics = {}
+        table_literal = qualified_name.replace("'", "''")
+        for stats_name, column_name in leading_columns:
+            stats_name = stats_name.replace("]", "]]")
+            try:
+                self.cursor.execute(
+                    f"DBCC SHOW_STATISTICS ('{table_literal}', [{stats_name}]) WITH DENSITY_VECTOR"
+                )
+                density_vector = self.cursor.fetchall()
+            except pyodbc.Error:
+                continue
+            
+            # The first row of the density vector covers the leading column alone
+            if not density_vector or not density_vector[0][0]:
+                continue
+            estimate = int(round(1 / density_vector[0][0]))
+            previous = column_statistics.get(column_name)
+            if previous is None or estimate > previous["distinct_estimate"]:
+                column_statistics[column_name] = {"distinct_estimate": estimate}
+        
+        attach_statistics(table_info, row_count, "catalog", column_statistics)
+
+    def _attach_scan_statistics(self, table_info, sample_size):
+        """
+        Profile a table in one streaming pass and attach the results.
+        
+        Args:
+            table_info (dict): Table entry built by extract_metadata
+            sample_size (int): Values kept per column
+        """
+        schema = table_info["schema"].replace("]", "]]")
+        table_name = table_info["name"].replace("]", "]]")
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT * FROM [{schema}].[{table_name}]")
+            column_names = [column[0] for column in cursor.description]
+            result = profile_rows(column_names, iter_batches(cursor), sample_size=sample_size)
+        except pyodbc.Error as err:
+            raise RuntimeError(f"Error profiling table {table_info['name']}: {err}") from err
+        finally:
+            cursor.close()
+            
+        attach_statistics(table_info, result["row_count"], "scan", result["columns"])
+
     def read_data(self, query):
         """
         Execute a query and return the results.
@@ -164,6 +263,38 @@ class SQLServerExtractor(BaseExtractor):
         except pyodbc.Error as err:
             error_msg = str(err)
             raise RuntimeError(f"Error executing query: {error_msg}") from err
+
+    def read_batches(self, query, batch_size=1000):
+        """
+        Execute a query and yield the results in batches.
+        
+        Rows are fetched with fetchmany, so only one batch is held in memory
+        at a time.
+        
+        Args:
+            query (str): SQL query to execute
+            batch_size (int): Maximum number of rows per batch
+            
+        Yields:
+            list: Batch of dictionaries containing the query results
+            
+        Raises:
+            ConnectionError: If not connected to the database
+            RuntimeError: If the query fails
+        """
+        if not self.connection or not self.cursor:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+            
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query)
+            columns = [column[0] for column in cursor.description]
+            for rows in iter_batches(cursor, batch_size):
+                yield [dict(zip(columns, row)) for row in rows]
+        except pyodbc.Error as err:
+            raise RuntimeError(f"Error executing query: {err}") from err
+        finally:
+            cursor.close()
                                 
     def close_connection(self):
         """
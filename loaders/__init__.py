@@ -0,0 +1,25 @@
+"""
+Loaders Package
+
+This package provides bulk loaders that write hubs, links and satellites to
+the data vault target. Each loader implements the BaseLoader interface
+defined in the abstractloader module.
+
+Database-specific subpackages are imported lazily, so importing this package
+does not load any database driver.
+"""
+
+import importlib
+
+from . import abstractloader
+
+_LAZY_SUBPACKAGES = ("mysql", "sqlserver", "sqlite")
+
+__all__ = ["abstractloader", "mysql", "sqlserver", "sqlite"]
+
+
+def __getattr__(name):
+    # Import driver-backed subpackages on first attribute access only
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,10 @@
+"""
+Abstract Loader Package
+
+This package provides the base loader class that defines the interface
+for all database-specific loaders that write to the data vault target.
+"""
+
+from .base_loader import BaseLoader
+
+__all__ = ['BaseLoader']
@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+
+class BaseLoader(ABC):
+    """
+    Abstract base class for all database loaders.
+    Defines the common interface that all specific database loaders must implement.
+
+    Rows are written in batches of ``batch_size``, each committed in its own
+    transaction. When key columns are given, rows whose key already exists in
+    the target are skipped, so a batch that is replayed after a failure does
+    not create duplicate hubs, links or satellites.
+    """
+    batch_size = 1000
+
+    @abstractmethod
+    def connect(self):
+        """
+        Establish a connection to the target database.
+        Must be implemented by subclasses.
+        """
+        pass
+
+    @abstractmethod
+    def load_batch(self, table, columns, rows, key_columns=None):
+        """
+        Write one batch of rows and commit it.
+
+        Args:
+            table (str): Target table name, optionally schema-qualified
+            columns (list): Column names, in the order of the row values
+            rows (list): Sequence of row tuples
+            key_columns (list): Columns identifying a row; existing keys are
+                skipped. If None, every row is inserted.
+
+        Returns:
+            int: Number of rows inserted
+        """
+        pass
+
+    @abstractmethod
+    def close_connection(self):
+        """
+        Close the database connection.
+        Must be implemented by subclasses.
+        """
+        pass
+
+    def load(self, table, columns, rows, key_columns=None):
+        """
+        Write rows to a table in batches of ``batch_size``.
+
+        Args:
+            table (str): Target table name, optionally schema-qualified
+            columns (list): Column names, in the order of the row values
+            rows (iterable): Row tuples; consumed lazily
+            key_columns (list): Columns identifying a row, see load_batch()
+
+        Returns:
+            int: Total number of rows inserted
+
+        Raises:
+            ValueError: If batch_size is not positive or a key column is not
+                one of the columns
+        """
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if key_columns:
+            missing = [key for key in key_columns if key not in columns]
+            if missing:
+                raise ValueError(f"Key columns not in columns: {', '.join(missing)}")
+
+        inserted = 0
+        batch = []
+        for row in rows:
+            batch.append(tuple(row))
+            if len(batch) >= self.batch_size:
+                inserted += self.load_batch(table, columns, batch, key_columns)
+                batch = []
+
+        if batch:
+            inserted += self.load_batch(table, columns, batch, key_columns)
+
+        return inserted
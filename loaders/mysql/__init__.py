@@ -0,0 +1,9 @@
+"""
+MySQL Loader Package
+
+This package provides bulk loading of data vault tables into MySQL databases.
+"""
+
+from .mysql_loader import MySQLLoader
+
+__all__ = ['MySQLLoader']
@@ -0,0 +1,239 @@
+"""
+MySQL Loader
+
+This module provides bulk loading of data vault tables into MySQL databases.
+"""
+
+import os
+import tempfile
+
+# Disable Pylint import errors for database drivers
+# These are installed in the Docker containers but may not be available in the development environment
+# pylint: disable=import-error
+import mysql.connector
+# pylint: enable=import-error
+from loaders.abstractloader import BaseLoader
+
+class MySQLLoader(BaseLoader):
+    """
+    MySQL specific implementation of the BaseLoader.
+
+    Each batch is sent as a single multi-row INSERT, or with LOAD DATA LOCAL
+    INFILE when ``use_load_data`` is set, and committed as one transaction.
+    Idempotent loads write the batch to a temporary staging table first and
+    copy across only the rows whose key is not already in the target, one row
+    per key. Any other error, including a collision on another unique index,
+    fails the batch. Picking one row per key uses ROW_NUMBER(), so idempotent
+    loads need MySQL 8.0 or later.
+    """
+
+    def __init__(self, host, port, database, user, password, batch_size=1000, use_load_data=False):
+        """
+        Initialize the MySQL loader with connection parameters.
+
+        Args:
+            host (str): Database host address
+            port (int): Database port
+            database (str): Database name
+            user (str): Database username
+            password (str): Database password
+            batch_size (int): Rows written per statement and transaction; keep
+                the statement below the server's max_allowed_packet
+            use_load_data (bool): Use LOAD DATA LOCAL INFILE instead of INSERT.
+                The server must have local_infile enabled.
+        """
+        self.host = host
+        self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.batch_size = batch_size
+        self.use_load_data = use_load_data
+        self.connection = None
+        self.cursor = None
+
+    def connect(self):
+        """
+        Establish a connection to the MySQL database.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            self.connection = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                autocommit=False,
+                allow_local_infile=self.use_load_data
+            )
+            self.cursor = self.connection.cursor()
+            return True
+        except mysql.connector.Error as err:
+            print(f"Error connecting to MySQL database: {err}")
+            return False
+
+    def load_batch(self, table, columns, rows, key_columns=None):
+        """
+        Write one batch of rows in a single transaction.
+
+        Args:
+            table (str): Target table name
+            columns (list): Column names, in the order of the row values
+            rows (list): Sequence of row tuples
+            key_columns (list): If given, rows with an existing key are skipped
+
+        Returns:
+            int: Number of rows inserted
+
+        Raises:
+            ConnectionError: If not connected to the database
+            RuntimeError: If the batch could not be written
+        """
+        if not self.connection or not self.cursor:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+        if not rows:
+            return 0
+
+        try:
+            if key_columns:
+                inserted = self._load_staged(table, columns, rows, key_columns)
+            else:
+                inserted = self._write(table, columns, rows)
+            self.connection.commit()
+            return inserted
+        except mysql.connector.Error as err:
+            self.connection.rollback()
+            raise RuntimeError(f"Error loading batch into {table}: {err}") from err
+
+    def _write(self, table, columns, rows):
+        """
+        Write the batch to a table with the configured bulk path.
+        """
+        if self.use_load_data:
+            return self._load_data(table, columns, rows)
+        return self._insert(table, columns, rows)
+
+    def _load_staged(self, table, columns, rows, key_columns):
+        """
+        Bulk-load the batch into a temporary table, then copy across the new keys.
+        """
+        target = _quote(table)
+        stage_name = "stage_" + "".join(ch if ch.isalnum() else "_" for ch in table)
+        stage = _quote(stage_name)
+        column_list = ", ".join(_quote(column) for column in columns)
+        key_list = ", ".join(_quote(key) for key in key_columns)
+        key_match = " AND ".join(f"tgt.{_quote(key)} = src.{_quote(key)}" for key in key_columns)
+
+        # Temporary tables do not commit the open transaction. CREATE ... SELECT
+        # keeps column types and NOT NULL, so bad values fail while staging.
+        self.cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {stage}")
+        self.cursor.execute(f"CREATE TEMPORARY TABLE {stage} AS SELECT {column_list} FROM {target} LIMIT 0")
+        self._write(stage_name, columns, rows)
+        self.cursor.execute(
+            f"INSERT INTO {target} ({column_list}) "
+            f"SELECT {column_list} FROM ("
+            f"SELECT {column_list}, ROW_NUMBER() OVER (PARTITION BY {key_list}) AS `__row_rank` "
+            f"FROM {stage}) AS src "
+            f"WHERE src.`__row_rank` = 1 "
+            f"AND NOT EXISTS (SELECT 1 FROM {target} AS tgt WHERE {key_match})"
+        )
+        inserted = self.cursor.rowcount
+        self.cursor.execute(f"DROP TEMPORARY TABLE {stage}")
+        return inserted
+
+    def _insert(self, table, columns, rows):
+        """
+        Send the batch as one multi-row INSERT statement.
+        """
+        column_list = ", ".join(_quote(column) for column in columns)
+        row_placeholder = "(" + ", ".join("%s" for _ in columns) + ")"
+        query = (
+            f"INSERT INTO {_quote(table)} ({column_list}) "
+            f"VALUES {', '.join(row_placeholder for _ in rows)}"
+        )
+
+        params = [value for row in rows for value in row]
+        self.cursor.execute(query, params)
+        return self.cursor.rowcount
+
+    def _load_data(self, table, columns, rows):
+        """
+        Write the batch to a temporary file and send it with LOAD DATA LOCAL INFILE.
+
+        With LOCAL, MySQL reports duplicate keys, truncation and NULLs in NOT
+        NULL columns as warnings instead of errors, so any warning fails the batch.
+        """
+        column_list = ", ".join(_quote(column) for column in columns)
+        fd, path = tempfile.mkstemp(prefix="mysql-load-", suffix=".tsv")
+        try:
+            with os.fdopen(fd, "wb") as data_file:
+                for row in rows:
+                    data_file.write(b"\t".join(_escape(value) for value in row))
+                    data_file.write(b"\n")
+
+            query = (
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {_quote(table)} "
+                "CHARACTER SET binary "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                "LINES TERMINATED BY '\\n' "
+                f"({column_list})"
+            )
+            self.cursor.execute(query, (path,))
+            loaded = self.cursor.rowcount
+
+            self.cursor.execute("SHOW WARNINGS")
+            warnings = self.cursor.fetchall()
+            if warnings:
+                level, code, message = warnings[0]
+                raise mysql.connector.DataError(
+                    msg=f"LOAD DATA reported {len(warnings)} warning(s), first: {level} {code} {message}"
+                )
+            return loaded
+        finally:
+            os.remove(path)
+
+    def close_connection(self):
+        """
+        Close the database connection.
+
+        Returns:
+            bool: True if connection closed successfully, False otherwise
+        """
+        if self.cursor:
+            self.cursor.close()
+
+        if self.connection:
+            try:
+                self.connection.close()
+                return True
+            except mysql.connector.Error as err:
+                print(f"Error closing connection: {err}")
+                return False
+
+        return True
+
+
+def _quote(identifier):
+    return ".".join("`" + part.replace("`", "``") + "`" for part in identifier.split("."))
+
+
+def _escape(value):
+    # Encode a value for LOAD DATA's tab-separated format. Text is written as
+    # UTF-8 and binary values as-is, so the file is loaded without conversion.
+    if value is None:
+        return b"\\N"
+    if isinstance(value, bool):
+        return b"1" if value else b"0"
+    if not isinstance(value, bytes):
+        value = str(value).encode("utf-8")
+    return (
+        value
+        .replace(b"\\", b"\\\\")
+        .replace(b"\t", b"\\t")
+        .replace(b"\n", b"\\n")
+        .replace(b"\r", b"\\r")
+        .replace(b"\0", b"\\0")
+    )
@@ -0,0 +1,9 @@
+"""
+SQLite Loader Package
+
+This package provides bulk loading of data vault tables into SQLite databases.
+"""
+
+from .sqlite_loader import SQLiteLoader
+
+__all__ = ['SQLiteLoader']
@@ -0,0 +1,104 @@
+"""
+SQLite Loader
+
+This module provides bulk loading into SQLite, used as a lightweight stand-in
+for the data vault target in development and tests.
+"""
+
+import sqlite3
+
+from loaders.abstractloader import BaseLoader
+
+class SQLiteLoader(BaseLoader):
+    """
+    SQLite specific implementation of the BaseLoader.
+
+    Each batch is written with a single executemany inside one transaction.
+    Idempotent loads use ON CONFLICT (key columns) DO NOTHING, so only rows
+    with an existing key are skipped and any other constraint violation fails
+    the batch. This needs a PRIMARY KEY or UNIQUE constraint over exactly the
+    key columns, and SQLite 3.24 or later.
+    """
+
+    def __init__(self, database, batch_size=1000):
+        """
+        Initialize the SQLite loader.
+
+        Args:
+            database (str): Path to the database file, or ":memory:"
+            batch_size (int): Rows written per transaction
+        """
+        self.database = database
+        self.batch_size = batch_size
+        self.connection = None
+
+    def connect(self):
+        """
+        Open the SQLite database.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            self.connection = sqlite3.connect(self.database)
+            return True
+        except sqlite3.Error as err:
+            print(f"Error connecting to SQLite database: {err}")
+            return False
+
+    def load_batch(self, table, columns, rows, key_columns=None):
+        """
+        Write one batch of rows in a single transaction.
+
+        Args:
+            table (str): Target table name
+            columns (list): Column names, in the order of the row values
+            rows (list): Sequence of row tuples
+            key_columns (list): If given, rows with an existing key are skipped
+
+        Returns:
+            int: Number of rows inserted
+
+        Raises:
+            ConnectionError: If not connected to the database
+            RuntimeError: If the batch could not be written
+        """
+        if not self.connection:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+
+        column_list = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        query = f"INSERT INTO {_quote(table)} ({column_list}) VALUES ({placeholders})"
+        if key_columns:
+            key_list = ", ".join(_quote(key) for key in key_columns)
+            query += f" ON CONFLICT ({key_list}) DO NOTHING"
+
+        try:
+            # The connection context manager commits on success and rolls back on error
+            with self.connection:
+                cursor = self.connection.executemany(query, rows)
+            return cursor.rowcount
+        except sqlite3.Error as err:
+            raise RuntimeError(f"Error loading batch into {table}: {err}") from err
+
+    def close_connection(self):
+        """
+        Close the database connection.
+
+        Returns:
+            bool: True if connection closed successfully, False otherwise
+        """
+        if self.connection:
+            try:
+                self.connection.close()
+                self.connection = None
+                return True
+            except sqlite3.Error as err:
+                print(f"Error closing connection: {err}")
+                return False
+
+        return True
+
+
+def _quote(identifier):
+    return ".".join('"' + part.replace('"', '""') + '"' for part in identifier.split("."))
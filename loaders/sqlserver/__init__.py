@@ -0,0 +1,9 @@
+"""
+SQL Server Loader Package
+
+This package provides bulk loading of data vault tables into SQL Server databases.
+"""
+
+from .sqlserver_loader import SQLServerLoader
+
+__all__ = ['SQLServerLoader']
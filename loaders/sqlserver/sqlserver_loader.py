@@ -0,0 +1,202 @@
+# Disable Pylint import errors for database drivers
+# These are installed in the Docker containers but may not be available in the development environment
+# pylint: disable=import-error
+import pyodbc
+# pylint: enable=import-error
+from loaders.abstractloader import BaseLoader
+
+class SQLServerLoader(BaseLoader):
+    """
+    SQL Server specific implementation of the BaseLoader.
+
+    Batches are sent with pyodbc's ``fast_executemany``, which binds the whole
+    batch as a parameter array in one round-trip. If a user-defined table type
+    is registered for the target table, the batch is sent as a table-valued
+    parameter instead. Idempotent loads go through a staging set and insert
+    only rows whose key is not already in the target, one row per key.
+    """
+
+    def __init__(self, host, port, database, user, password, batch_size=5000, table_types=None):
+        """
+        Initialize the SQL Server loader with connection parameters.
+
+        Args:
+            host (str): Database host address
+            port (int): Database port
+            database (str): Database name
+            user (str): Database username
+            password (str): Database password
+            batch_size (int): Rows written per round-trip and transaction
+            table_types (dict): Maps target table names to the user-defined
+                table type used to send them as a table-valued parameter,
+                e.g. {"dv.hub_customer": "dv.hub_customer_type"}
+        """
+        self.host = host
+        self.port = port
+        self.database = database
+        self.user = user
+        self.password = password
+        self.batch_size = batch_size
+        self.table_types = table_types or {}
+        self.connection = None
+        self.cursor = None
+
+    def connect(self):
+        """
+        Establish a connection to the SQL Server database.
+
+        Returns:
+            Connection: A connection object to the SQL Server database.
+
+        Raises:
+            ConnectionError: If unable to connect to the database.
+            ValueError: If connection parameters are invalid or missing.
+        """
+        try:
+            conn_str = (
+                f"DRIVER={{ODBC Driver 17 for SQL Server}};"
+                f"SERVER={self.host},{self.port};"
+                f"DATABASE={self.database};"
+                f"UID={self.user};"
+                f"PWD={self.password};"
+            )
+
+            self.connection = pyodbc.connect(conn_str, autocommit=False)
+            self.cursor = self.connection.cursor()
+            self.cursor.fast_executemany = True
+            return self.connection
+        except pyodbc.Error as e:
+            error_msg = str(e)
+            if "Invalid connection string attribute" in error_msg or "Data source name not found" in error_msg:
+                raise ValueError(f"Configuration error: {error_msg}") from e
+            else:
+                raise ConnectionError(f"Failed to connect to SQL Server: {error_msg}") from e
+
+    def load_batch(self, table, columns, rows, key_columns=None):
+        """
+        Write one batch of rows in a single transaction.
+
+        Args:
+            table (str): Target table name, optionally schema-qualified
+            columns (list): Column names, in the order of the row values
+            rows (list): Sequence of row tuples
+            key_columns (list): If given, rows with an existing key are skipped
+
+        Returns:
+            int: Number of rows inserted
+
+        Raises:
+            ConnectionError: If not connected to the database
+            RuntimeError: If the batch could not be written
+        """
+        if not self.connection or not self.cursor:
+            raise ConnectionError("Not connected to database. Call connect() first.")
+        if not rows:
+            return 0
+
+        try:
+            if table in self.table_types:
+                inserted = self._load_tvp(table, columns, rows, key_columns)
+            elif key_columns:
+                inserted = self._load_staged(table, columns, rows, key_columns)
+            else:
+                inserted = self._load_direct(table, columns, rows)
+            self.connection.commit()
+            return inserted
+        except pyodbc.Error as err:
+            self.connection.rollback()
+            raise RuntimeError(f"Error loading batch into {table}: {err}") from err
+
+    def _load_direct(self, table, columns, rows):
+        """
+        Insert the batch straight into the target with fast_executemany.
+        """
+        column_list = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        self.cursor.executemany(
+            f"INSERT INTO {_quote(table)} ({column_list}) VALUES ({placeholders})",
+            rows
+        )
+        return len(rows)
+
+    def _load_staged(self, table, columns, rows, key_columns):
+        """
+        Bulk-insert the batch into a temp table, then copy across the new keys.
+        """
+        target = _quote(table)
+        stage = "#stage_" + "".join(ch if ch.isalnum() else "_" for ch in table)
+        column_list = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join("?" for _ in columns)
+
+        self.cursor.execute(
+            f"IF OBJECT_ID('tempdb..{stage}') IS NOT NULL DROP TABLE {stage}; "
+            f"SELECT TOP 0 {column_list} INTO {stage} FROM {target}"
+        )
+        self.cursor.executemany(f"INSERT INTO {stage} ({column_list}) VALUES ({placeholders})", rows)
+        self.cursor.execute(_insert_new_keys(target, stage, columns, key_columns))
+        inserted = self.cursor.rowcount
+        self.cursor.execute(f"DROP TABLE {stage}")
+        return inserted
+
+    def _load_tvp(self, table, columns, rows, key_columns):
+        """
+        Send the batch as a table-valued parameter in a single statement.
+        """
+        target = _quote(table)
+        column_list = ", ".join(_quote(column) for column in columns)
+        if key_columns:
+            query = _insert_new_keys(target, "?", columns, key_columns)
+        else:
+            query = f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM ? AS src"
+
+        # pyodbc takes the type name and schema as the first two elements of the TVP
+        type_schema, _, type_name = self.table_types[table].rpartition(".")
+        tvp = [type_name, type_schema or "dbo"] + [tuple(row) for row in rows]
+        self.cursor.execute(query, (tvp,))
+        return self.cursor.rowcount
+
+    def close_connection(self):
+        """
+        Close the database connection.
+
+        Returns:
+            bool: True if connection closed successfully, False otherwise
+        """
+        if self.cursor:
+            try:
+                self.cursor.close()
+            except pyodbc.Error:
+                pass  # Ignore errors when closing cursor
+
+        if self.connection:
+            try:
+                self.connection.close()
+                self.connection = None
+                self.cursor = None
+                return True
+            except pyodbc.Error as err:
+                print(f"Error closing connection: {err}")
+                return False
+
+        return True
+
+
+def _quote(identifier):
+    return ".".join("[" + part.replace("]", "]]") + "]" for part in identifier.split("."))
+
+
+def _insert_new_keys(target, source, columns, key_columns):
+    # Keep one row per key from the source, then skip keys already in the
+    # target. Ranking on the keys alone also works for xml/text columns,
+    # which DISTINCT cannot compare.
+    column_list = ", ".join(_quote(column) for column in columns)
+    key_list = ", ".join(_quote(key) for key in key_columns)
+    key_match = " AND ".join(f"tgt.{_quote(key)} = src.{_quote(key)}" for key in key_columns)
+    return (
+        f"INSERT INTO {target} ({column_list}) "
+        f"SELECT {column_list} FROM ("
+        f"SELECT {column_list}, ROW_NUMBER() OVER (PARTITION BY {key_list} ORDER BY (SELECT NULL)) AS [__row_rank] "
+        f"FROM {source}) AS src "
+        f"WHERE src.[__row_rank] = 1 "
+        f"AND NOT EXISTS (SELECT 1 FROM {target} AS tgt WHERE {key_match})"
+    )
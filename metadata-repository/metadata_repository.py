@@ -12,6 +12,15 @@ metadata_lock = Lock()
 metadata_store = {}
 schema_change_events = []
 
+def strip_statistics(metadata):
+    # Profiling statistics change on every run; only the schema itself should
+    # raise a schema_changed event.
+    if isinstance(metadata, dict):
+        return {k: strip_statistics(v) for k, v in metadata.items() if k != 'statistics'}
+    if isinstance(metadata, list):
+        return [strip_statistics(item) for item in metadata]
+    return metadata
+
 @app.route('/metadata', methods=['POST'])
 def save_metadata():
     try:
@@ -25,8 +34,10 @@ def save_metadata():
         source_id = data['source_id']
         
         with metadata_lock:
+            previous = metadata_store.get(source_id)
             metadata_store[source_id] = data['metadata']
-            schema_change_events.append({'source_id': source_id, 'event': 'schema_changed'})
+            if previous is None or strip_statistics(previous) != strip_statistics(data['metadata']):
+                schema_change_events.append({'source_id': source_id, 'event': 'schema_changed'})
         
         logger.info(f"Saved metadata for source_id: {source_id}")
         return jsonify({"status": "success"}), 201
@@ -35,6 +46,14 @@ def save_metadata():
         logger.error(f"Error saving metadata: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/metadata/<source_id>', methods=['GET'])
+def get_metadata(source_id):
+    with metadata_lock:
+        metadata = metadata_store.get(source_id)
+    if metadata is None:
+        return jsonify({"error": f"No metadata for source_id: {source_id}"}), 404
+    return jsonify(metadata)
+
 @app.route('/events', methods=['GET'])
 def get_events():
     with metadata_lock:
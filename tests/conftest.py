@@ -0,0 +1,38 @@
+import sys
+import types
+
+import pytest
+
+
+class FakeDriverError(Exception):
+    def __init__(self, *args, msg=None):
+        super().__init__(*(args or (msg,)))
+
+
+def _forget_modules(monkeypatch, *prefixes):
+    # Drop cached modules so they are imported again against the fake driver
+    for name in list(sys.modules):
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in prefixes):
+            monkeypatch.delitem(sys.modules, name)
+
+
+@pytest.fixture
+def fake_mysql(monkeypatch):
+    connector = types.ModuleType("mysql.connector")
+    connector.Error = FakeDriverError
+    connector.DataError = type("DataError", (FakeDriverError,), {})
+    package = types.ModuleType("mysql")
+    package.connector = connector
+    monkeypatch.setitem(sys.modules, "mysql", package)
+    monkeypatch.setitem(sys.modules, "mysql.connector", connector)
+    _forget_modules(monkeypatch, "extractors.mysql", "loaders.mysql")
+    return connector
+
+
+@pytest.fixture
+def fake_pyodbc(monkeypatch):
+    pyodbc = types.ModuleType("pyodbc")
+    pyodbc.Error = FakeDriverError
+    monkeypatch.setitem(sys.modules, "pyodbc", pyodbc)
+    _forget_modules(monkeypatch, "extractors.sqlserver", "loaders.sqlserver")
+    return pyodbc
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from extractors.abstractextractor import BaseExtractor
+from extractors.pipeline import ExtractPipeline
+
+
+class FakeExtractor(BaseExtractor):
+    def __init__(self, rows_per_query):
+        self.rows_per_query = rows_per_query
+
+    def connect(self):
+        return True
+
+    def extract_metadata(self, profile=None):
+        return {"tables": []}
+
+    def read_data(self, query):
+        return [{"query": query, "id": i} for i in range(self.rows_per_query)]
+
+    def close_connection(self):
+        return True
+
+
+class FakeStream:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+
+    def stream_changes(self, changes):
+        if self.fail:
+            raise IOError("broker unavailable")
+        time.sleep(self.delay)
+        self.received.extend(changes)
+
+
+def test_rows_keep_fifo_order_across_spill(tmp_path):
+    stream = FakeStream(delay=0.001)
+    pipeline = ExtractPipeline(
+        FakeExtractor(rows_per_query=3000),
+        stream,
+        batch_size=100,
+        high_watermark=500,
+        low_watermark=100,
+        spill_dir=str(tmp_path),
+        segment_rows=300
+    )
+
+    stats = pipeline.run(["a", "b"])
+
+    expected = [{"query": q, "id": i} for q in ("a", "b") for i in range(3000)]
+    assert stream.received == expected
+    assert stats["buffer"]["spilled_rows"] > 0
+    assert stats["lag_rows"] == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_failure_stops_extraction():
+    read = {"batches": 0, "closed": False}
+
+    class SlowSourceExtractor(FakeExtractor):
+        def read_batches(self, query, batch_size=1000):
+            try:
+                for i in range(1000):
+                    read["batches"] += 1
+                    yield [{"id": i}]
+                    # Hold the source until the stream stage has failed on the first batch
+                    deadline = time.monotonic() + 5
+                    while pipeline._stream_error is None and time.monotonic() < deadline:
+                        time.sleep(0.01)
+            finally:
+                read["closed"] = True
+
+    pipeline = ExtractPipeline(
+        SlowSourceExtractor(rows_per_query=0),
+        FakeStream(fail=True),
+        batch_size=1,
+        max_retries=1,
+        retry_backoff=0.01
+    )
+
+    with pytest.raises(RuntimeError, match="broker unavailable"):
+        pipeline.run(["a", "b"])
+
+    assert read["batches"] < 10
+    assert read["closed"]
+    assert pipeline.stats()["extract"]["queries"] == 0
+
+
+def test_buffer_failure_is_reported(monkeypatch):
+    pipeline = ExtractPipeline(FakeExtractor(rows_per_query=1000), FakeStream(), batch_size=10)
+    get = pipeline.queue.get
+    calls = {"count": 0}
+
+    def failing_get(timeout=None):
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise OSError("spill segment unreadable")
+        return get(timeout)
+
+    monkeypatch.setattr(pipeline.queue, "get", failing_get)
+
+    with pytest.raises(RuntimeError, match="spill segment unreadable"):
+        pipeline.run(["a"])
+
+
+def test_undelivered_rows_fail_the_run(monkeypatch):
+    pipeline = ExtractPipeline(FakeExtractor(rows_per_query=100), FakeStream(), batch_size=10)
+    monkeypatch.setattr(pipeline, "_stream_worker", lambda: None)
+
+    with pytest.raises(RuntimeError, match="100 extracted rows undelivered"):
+        pipeline.run(["a"])
@@ -0,0 +1,105 @@
+import pytest
+
+
+def test_mysql_load_data_escaping(fake_mysql):
+    from loaders.mysql.mysql_loader import _escape
+
+    assert _escape(None) == b"\\N"
+    assert _escape("\\N") == b"\\\\N"
+    assert _escape("a\tb\nc\rd") == b"a\\tb\\nc\\rd"
+    assert _escape("nul\0byte") == b"nul\\0byte"
+    assert _escape("back\\slash") == b"back\\\\slash"
+    assert _escape(True) == b"1"
+    assert _escape(b"\x00\xff\t") == b"\\0\xff\\t"
+    assert _escape("caf\u00e9") == "caf\u00e9".encode("utf-8")
+
+
+def test_mysql_quotes_schema_qualified_names(fake_mysql):
+    from loaders.mysql.mysql_loader import _quote
+
+    assert _quote("dv.hub_customer") == "`dv`.`hub_customer`"
+    assert _quote("odd`name") == "`odd``name`"
+
+
+def test_sqlserver_quotes_schema_qualified_names(fake_pyodbc):
+    from loaders.sqlserver.sqlserver_loader import _quote
+
+    assert _quote("dv.hub_customer") == "[dv].[hub_customer]"
+    assert _quote("odd]name") == "[odd]]name]"
+
+
+def test_sqlserver_insert_new_keys_ranks_on_keys_only(fake_pyodbc):
+    from loaders.sqlserver.sqlserver_loader import _insert_new_keys
+
+    query = _insert_new_keys(
+        "[dv].[sat_customer]", "#stage", ["hash_key", "load_date", "payload"], ["hash_key", "load_date"]
+    )
+
+    assert query == (
+        "INSERT INTO [dv].[sat_customer] ([hash_key], [load_date], [payload]) "
+        "SELECT [hash_key], [load_date], [payload] FROM ("
+        "SELECT [hash_key], [load_date], [payload], ROW_NUMBER() OVER "
+        "(PARTITION BY [hash_key], [load_date] ORDER BY (SELECT NULL)) AS [__row_rank] "
+        "FROM #stage) AS src "
+        "WHERE src.[__row_rank] = 1 "
+        "AND NOT EXISTS (SELECT 1 FROM [dv].[sat_customer] AS tgt "
+        "WHERE tgt.[hash_key] = src.[hash_key] AND tgt.[load_date] = src.[load_date])"
+    )
+    assert "DISTINCT" not in query
+
+
+class RecordingCursor:
+    rowcount = 1
+
+    def __init__(self, warnings=()):
+        self.warnings = list(warnings)
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+
+    def fetchall(self):
+        return self.warnings
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.committed = False
+        self.rolled_back = False
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def make_mysql_loader(use_load_data, warnings=()):
+    from loaders.mysql import MySQLLoader
+
+    loader = MySQLLoader("host", 3306, "db", "user", "password", use_load_data=use_load_data)
+    loader.cursor = RecordingCursor(warnings)
+    loader.connection = RecordingConnection()
+    return loader
+
+
+def test_mysql_keyed_load_goes_through_staging(fake_mysql):
+    loader = make_mysql_loader(use_load_data=False)
+
+    loader.load_batch("dv.hub_customer", ["hash_key", "business_key"], [("h1", "c1")], key_columns=["hash_key"])
+
+    queries = loader.cursor.queries
+    assert queries[0] == "DROP TEMPORARY TABLE IF EXISTS `stage_dv_hub_customer`"
+    assert queries[2].startswith("INSERT INTO `stage_dv_hub_customer` (`hash_key`, `business_key`) VALUES")
+    assert "NOT EXISTS (SELECT 1 FROM `dv`.`hub_customer` AS tgt WHERE tgt.`hash_key` = src.`hash_key`)" in queries[3]
+    assert loader.connection.committed
+
+
+def test_mysql_load_data_warnings_fail_the_batch(fake_mysql):
+    loader = make_mysql_loader(use_load_data=True, warnings=[("Warning", 1265, "Data truncated for column 'bk'")])
+
+    with pytest.raises(RuntimeError, match="Data truncated"):
+        loader.load_batch("dv.hub_customer", ["hash_key", "bk"], [("h1", "x" * 100)])
+
+    assert loader.connection.rolled_back
+    assert not loader.connection.committed
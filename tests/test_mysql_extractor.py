@@ -0,0 +1,40 @@
+import types
+
+
+class FakeUnbufferedCursor:
+    def __init__(self, total_rows):
+        self.remaining = total_rows
+        self.largest_fetch = 0
+        self.closed = False
+
+    def execute(self, query, params=None):
+        pass
+
+    def fetchmany(self, size):
+        count = min(size, self.remaining)
+        self.remaining -= count
+        self.largest_fetch = max(self.largest_fetch, count)
+        return [{"id": i} for i in range(count)]
+
+    def fetchall(self):
+        raise AssertionError("fetchall would load the rest of the result into memory")
+
+    def close(self):
+        assert self.remaining == 0, "unbuffered cursor closed with unread rows"
+        self.closed = True
+
+
+def test_abandoned_read_drains_in_bounded_chunks(fake_mysql):
+    from extractors.mysql import MySQLExtractor
+
+    cursor = FakeUnbufferedCursor(total_rows=100000)
+    extractor = MySQLExtractor("host", 3306, "db", "user", "password")
+    extractor.connection = types.SimpleNamespace(cursor=lambda **kwargs: cursor)
+    extractor.cursor = object()
+
+    batches = extractor.read_batches("SELECT * FROM big_table", batch_size=50)
+    assert len(next(batches)) == 50
+    batches.close()
+
+    assert cursor.closed
+    assert cursor.largest_fetch == 50
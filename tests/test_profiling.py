@@ -0,0 +1,45 @@
+import datetime
+import decimal
+import json
+
+from extractors.abstractextractor import profile_rows
+
+
+def test_profile_is_json_serializable_and_unsampled_by_default():
+    rows = [
+        (datetime.date(2024, 1, day), decimal.Decimal(f"{day}.50"), bytes([day]) * 20, None)
+        for day in range(1, 11)
+    ]
+
+    result = profile_rows(["day", "amount", "hash_key", "note"], [rows])
+
+    assert result["row_count"] == 10
+    day = result["columns"]["day"]
+    assert day["min"] == "2024-01-01"
+    assert day["max"] == "2024-01-10"
+    assert result["columns"]["amount"]["max"] == "10.50"
+    assert result["columns"]["hash_key"]["min"] == "0x" + "01" * 16 + "..."
+    assert result["columns"]["note"]["null_ratio"] == 1.0
+    assert all("sample" not in column for column in result["columns"].values())
+    json.dumps(result)
+
+
+def test_sample_is_opt_in():
+    rows = [(datetime.datetime(2024, 1, 1, hour),) for hour in range(24)]
+
+    result = profile_rows(["loaded_at"], [rows], sample_size=5, seed=1)
+
+    sample = result["columns"]["loaded_at"]["sample"]
+    assert len(sample) == 5
+    assert all(isinstance(value, str) for value in sample)
+    assert abs(result["columns"]["loaded_at"]["distinct_estimate"] - 24) <= 2
+
+
+def test_text_min_max_are_cut_to_a_prefix():
+    rows = [("a" * 10000,), ("b" * 10,)]
+
+    result = profile_rows(["body"], [rows])
+
+    body = result["columns"]["body"]
+    assert body["min"] == "a" * 16 + "..."
+    assert body["max"] == "b" * 10
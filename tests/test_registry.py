@@ -0,0 +1,107 @@
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from extractors import registry
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENV = {
+    "DB_TYPE": "mysql",
+    "DB_HOST": "mysql-db-host",
+    "DB_USER": "mysql-user",
+    "DB_PASSWORD": "mysql-password",
+    "DB_NAME": "mysql-db",
+}
+
+
+class RecordingExtractor:
+    def __init__(self, **params):
+        self.params = params
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_targets", dict(registry._targets))
+    monkeypatch.setattr(registry, "_default_ports", dict(registry._default_ports))
+    monkeypatch.setattr(registry, "_loaded", {})
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+    monkeypatch.setattr(registry, "entry_points", lambda: types.SimpleNamespace(select=lambda group: []))
+
+
+def test_importing_package_loads_no_driver():
+    code = (
+        "import sys, extractors\n"
+        "loaded = [m for m in ('extractors.mysql', 'extractors.sqlserver', 'pyodbc', 'mysql.connector')"
+        " if m in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
+
+
+def test_missing_variable_is_a_configuration_error():
+    environ = dict(ENV)
+    del environ["DB_HOST"]
+
+    with pytest.raises(ValueError, match="DB_HOST"):
+        registry.create_extractor_from_env(environ=environ)
+
+
+def test_unknown_type_is_a_configuration_error():
+    with pytest.raises(ValueError, match="Unknown extractor 'oracle'"):
+        registry.create_extractor_from_env(environ=dict(ENV, DB_TYPE="oracle"))
+
+
+def test_default_port_is_used_when_unset():
+    registry.register_extractor("mysql", RecordingExtractor)
+
+    extractor = registry.create_extractor_from_env(environ=ENV)
+
+    assert extractor.params == {
+        "host": "mysql-db-host",
+        "port": 3306,
+        "database": "mysql-db",
+        "user": "mysql-user",
+        "password": "mysql-password",
+    }
+
+
+def test_string_target_is_resolved_on_first_use(monkeypatch):
+    module = types.ModuleType("fake_db2_extractor")
+    module.DB2Extractor = RecordingExtractor
+    imported = []
+
+    def import_module(name):
+        imported.append(name)
+        return module
+
+    monkeypatch.setattr(registry.importlib, "import_module", import_module)
+    registry.register_extractor("db2", "fake_db2_extractor:DB2Extractor", default_port=50000)
+    assert imported == []
+
+    assert registry.get_extractor_class("DB2") is RecordingExtractor
+    assert registry.get_extractor_class("db2") is RecordingExtractor
+    assert imported == ["fake_db2_extractor"]
+
+
+def test_entry_points_are_discovered(monkeypatch):
+    entry_point = types.SimpleNamespace(name="Teradata", value="fake_teradata:TeradataExtractor")
+    groups = []
+
+    def select(group):
+        groups.append(group)
+        return [entry_point]
+
+    monkeypatch.setattr(registry, "entry_points", lambda: types.SimpleNamespace(select=select))
+    module = types.ModuleType("fake_teradata")
+    module.TeradataExtractor = RecordingExtractor
+    monkeypatch.setitem(sys.modules, "fake_teradata", module)
+
+    assert "teradata" in registry.available_extractors()
+    assert registry.get_extractor_class("teradata") is RecordingExtractor
+    assert groups == [registry.ENTRY_POINT_GROUP]
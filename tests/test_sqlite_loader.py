@@ -0,0 +1,38 @@
+import pytest
+
+from loaders.sqlite import SQLiteLoader
+
+
+@pytest.fixture
+def loader():
+    loader = SQLiteLoader(":memory:", batch_size=2)
+    loader.connect()
+    loader.connection.execute("CREATE TABLE hub_customer (hash_key TEXT PRIMARY KEY, business_key TEXT NOT NULL)")
+    yield loader
+    loader.close_connection()
+
+
+def count_rows(loader):
+    return loader.connection.execute("SELECT COUNT(*) FROM hub_customer").fetchone()[0]
+
+
+def test_replayed_load_skips_existing_keys(loader):
+    rows = [("h1", "c1"), ("h2", "c2"), ("h3", "c3")]
+
+    assert loader.load("hub_customer", ["hash_key", "business_key"], rows, key_columns=["hash_key"]) == 3
+    assert loader.load("hub_customer", ["hash_key", "business_key"], rows, key_columns=["hash_key"]) == 0
+    assert count_rows(loader) == 3
+
+
+def test_other_constraint_violations_fail_the_batch(loader):
+    with pytest.raises(RuntimeError, match="NOT NULL"):
+        loader.load("hub_customer", ["hash_key", "business_key"], [("h1", None)], key_columns=["hash_key"])
+
+    assert count_rows(loader) == 0
+
+
+def test_non_positive_batch_size_is_rejected(loader):
+    loader.batch_size = 0
+
+    with pytest.raises(ValueError, match="batch_size"):
+        loader.load("hub_customer", ["hash_key", "business_key"], [("h1", "c1")])
@@ -0,0 +1,50 @@
+class ScriptedCursor:
+    def __init__(self, responses, driver_error):
+        self.responses = responses
+        self.driver_error = driver_error
+        self.queries = []
+        self.result = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        for marker, response in self.responses:
+            if marker in query:
+                if isinstance(response, Exception):
+                    raise response
+                self.result = response
+                return
+        raise AssertionError(f"unexpected query: {query}")
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+
+def test_catalog_statistics_include_density_distinct_estimates(fake_pyodbc):
+    from extractors.sqlserver.sqlserver_extractor import SQLServerExtractor
+
+    cursor = ScriptedCursor([
+        ("sys.partitions", [(1000,)]),
+        ("sys.stats ", [("PK_hub", "hash_key"), ("IX_load", "load_date"), ("_WA_Sys_secret", "note")]),
+        ("[PK_hub]", [(0.001, 16.0, "hash_key")]),
+        ("[IX_load]", [(0.04, 8.0, "load_date"), (0.001, 24.0, "load_date, hash_key")]),
+        ("[_WA_Sys_secret]", fake_pyodbc.Error("permission denied")),
+    ], fake_pyodbc.Error)
+    extractor = SQLServerExtractor("host", 1433, "db", "user", "password")
+    extractor.cursor = cursor
+    table_info = {
+        "name": "hub",
+        "schema": "dv",
+        "columns": [{"name": "hash_key"}, {"name": "load_date"}, {"name": "note"}],
+    }
+
+    extractor._attach_catalog_statistics(table_info)
+
+    assert table_info["statistics"] == {"row_count": 1000, "source": "catalog"}
+    columns = {column["name"]: column for column in table_info["columns"]}
+    assert columns["hash_key"]["statistics"] == {"distinct_estimate": 1000}
+    assert columns["load_date"]["statistics"] == {"distinct_estimate": 25}
+    assert "statistics" not in columns["note"]
+    assert "DBCC SHOW_STATISTICS ('[dv].[hub]', [PK_hub]) WITH DENSITY_VECTOR" in cursor.queries